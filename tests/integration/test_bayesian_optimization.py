@@ -20,6 +20,7 @@ import tensorflow as tf
 from trieste.acquisition.rule import (
     AcquisitionRule,
     EfficientGlobalOptimization,
+    KrigingBeliever,
     ThompsonSampling,
     TrustRegion,
     OBJECTIVE
@@ -40,9 +41,10 @@ from tests.util.misc import random_seed
 
 @random_seed(1793)
 @pytest.mark.parametrize('num_steps, acquisition_rule', [
-    (12, EfficientGlobalOptimization()),
+    (25, EfficientGlobalOptimization()),
     (22, TrustRegion()),
     (17, ThompsonSampling(500, 3)),
+    (10, KrigingBeliever(3)),
 ])
 def test_optimizer_finds_minima_of_the_branin_function(
         num_steps: int, acquisition_rule: AcquisitionRule
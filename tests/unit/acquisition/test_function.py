@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import os
+from typing import Callable, TypeVar
 from unittest.mock import MagicMock
 
 import pytest
@@ -31,10 +34,41 @@ from trieste.acquisition.function import (
     probability_of_feasibility,
 )
 from trieste.models import ModelInterface
-from tests.util.misc import ShapeLike, various_shapes, zero_dataset
+from trieste.utils import jit
+from tests.util.misc import ShapeLike, cached_ones, various_shapes, zero_dataset
 from tests.util.model import QuadraticWithUnitVariance
 
 
+_QUERY_AT_7 = tf.constant([[-3.], [-2.], [-1.], [0.], [1.], [2.], [3.]])
+_QUERY_AT_9 = tf.constant([[-2.0], [-1.5], [-1.0], [-0.5], [0.0], [0.5], [1.0], [1.5], [2.0]])
+_ETA_ZERO = tf.constant([0.])
+_NON_SCALAR_SHAPES = sorted(various_shapes() - {()}, key=str)
+_STD_NORMAL = tfp.distributions.Normal(0., 1.)
+
+C = TypeVar('C', bound=Callable)
+
+_APPLY_JIT = os.environ.get("TRIESTE_TEST_JIT") == "1"
+
+_XLA_COMPILE = {
+    "jit_compile" if tuple(map(int, tf.__version__.split(".")[:2])) >= (2, 5)
+    else "experimental_compile": True
+}
+"""
+The argument to `tf.function` that compiles a function with XLA. TensorFlow 2.5 renamed it from
+``experimental_compile`` to ``jit_compile``, and setup.py allows earlier versions.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _jit(f: C) -> C:
+    """
+    :param f: The function to compile.
+    :return: ``f`` compiled with XLA if the environment variable `TRIESTE_TEST_JIT` is set to `1`,
+        else ``f`` itself, so that tests run eagerly (and are easier to debug) by default.
+    """
+    return jit(apply=_APPLY_JIT, **_XLA_COMPILE)(f)
+
+
 class _IdentitySingleBuilder(SingleModelAcquisitionBuilder):
     def prepare_acquisition_function(
         self, dataset: Dataset, model: ModelInterface
@@ -42,13 +76,13 @@ class _IdentitySingleBuilder(SingleModelAcquisitionBuilder):
         return lambda at: at
 
 
-def test_single_builder_raises_immediately_for_wrong_key() -> None:
+def test_single_builder_raises_immediately_for_wrong_key(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
     builder = _IdentitySingleBuilder().using("foo")
 
     with pytest.raises(KeyError):
-        builder.prepare_acquisition_function(
-            {"bar": zero_dataset()}, {"bar": QuadraticWithUnitVariance()}
-        )
+        builder.prepare_acquisition_function({"bar": zero_ds}, {"bar": quadratic_model})
 
 
 def test_single_builder_repr_includes_class_name() -> None:
@@ -71,37 +105,38 @@ def test_single_builder_using_passes_on_correct_dataset_and_model() -> None:
     builder.prepare_acquisition_function(data, models)
 
 
-@pytest.mark.parametrize('query_at', [
-    tf.constant([[-2.0], [-1.5], [-1.0], [-0.5], [0.0], [0.5], [1.0], [1.5], [2.0]])
-])
+@pytest.mark.parametrize('query_at', [_QUERY_AT_9])
 def test_expected_improvement_builder_builds_expected_improvement(
-        query_at: tf.Tensor
+        query_at: tf.Tensor, quadratic_model: QuadraticWithUnitVariance
 ) -> None:
     dataset = Dataset(tf.constant([[-2.], [-1.], [0.], [1.], [2.]]), tf.zeros([5, 1]))
-    model = QuadraticWithUnitVariance()
+    model = quadratic_model
     builder = ExpectedImprovement()
     acq_fn = builder.prepare_acquisition_function(dataset, model)
-    expected = expected_improvement(model, tf.constant([0.]), query_at)
+    expected = expected_improvement(model, _ETA_ZERO, query_at)
     npt.assert_array_almost_equal(acq_fn(query_at), expected)
 
 
-def test_expected_improvement() -> None:
-    def _ei(x: tf.Tensor) -> tf.Tensor:
-        n = tfp.distributions.Normal(0, 1)
-        return - x * n.cdf(-x) + n.prob(-x)
+@tf.function(input_signature=[tf.TensorSpec([None, 1], tf.float32)], **_XLA_COMPILE)
+def _ei(x: tf.Tensor) -> tf.Tensor:
+    return - x * _STD_NORMAL.cdf(-x) + _STD_NORMAL.prob(-x)
 
-    query_at = tf.constant([[-2.0], [-1.5], [-1.0], [-0.5], [0.0], [0.5], [1.0], [1.5], [2.0]])
-    actual = expected_improvement(QuadraticWithUnitVariance(), tf.constant([0.]), query_at)
+
+def test_expected_improvement(quadratic_model: QuadraticWithUnitVariance) -> None:
+    query_at = _QUERY_AT_9
+    actual = _jit(expected_improvement)(quadratic_model, _ETA_ZERO, query_at)
     npt.assert_array_almost_equal(actual, _ei(query_at ** 2))
 
 
-def test_negative_lower_confidence_bound_builder_builds_negative_lower_confidence_bound() -> None:
-    model = QuadraticWithUnitVariance()
+def test_negative_lower_confidence_bound_builder_builds_negative_lower_confidence_bound(
+    quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    model = quadratic_model
     beta = 1.96
     acq_fn = NegativeLowerConfidenceBound(beta).prepare_acquisition_function(
         Dataset(tf.constant([[]]), tf.constant([[]])), model
     )
-    query_at = tf.constant([[-3.], [-2.], [-1.], [0.], [1.], [2.], [3.]])
+    query_at = _QUERY_AT_7
     expected = - lower_confidence_bound(model, beta, query_at)
     npt.assert_array_almost_equal(acq_fn(query_at), expected)
 
@@ -112,11 +147,19 @@ def test_lower_confidence_bound_raises_for_negative_beta(beta: float) -> None:
         lower_confidence_bound(MagicMock(ModelInterface), beta, tf.constant([[]]))
 
 
+@tf.function(
+    input_signature=[tf.TensorSpec([None, 1], tf.float32), tf.TensorSpec([], tf.float32)],
+    **_XLA_COMPILE,
+)
+def _lcb(x: tf.Tensor, beta: tf.Tensor) -> tf.Tensor:
+    return x ** 2 - beta
+
+
 @pytest.mark.parametrize('beta', [0.0, 0.1, 7.8])
-def test_lower_confidence_bound(beta: float) -> None:
-    query_at = tf.constant([[-3.], [-2.], [-1.], [0.], [1.], [2.], [3.]])
-    actual = lower_confidence_bound(QuadraticWithUnitVariance(), beta, query_at)
-    npt.assert_array_almost_equal(actual, query_at ** 2 - beta)
+def test_lower_confidence_bound(beta: float, quadratic_model: QuadraticWithUnitVariance) -> None:
+    query_at = _QUERY_AT_7
+    actual = _jit(lower_confidence_bound)(quadratic_model, beta, query_at)
+    npt.assert_array_almost_equal(actual, _lcb(query_at, beta))
 
 
 @pytest.mark.parametrize('threshold, at, expected', [
@@ -125,38 +168,49 @@ def test_lower_confidence_bound(beta: float) -> None:
     (2.0, tf.constant([[1.0]]), 0.5 + 0.34134),
     (-0.25, tf.constant([[-0.5]]), 0.5 - 0.19146),
 ])
-def test_probability_of_feasibility(threshold: float, at: tf.Tensor, expected: float) -> None:
-    actual = probability_of_feasibility(QuadraticWithUnitVariance(), threshold, at)
+def test_probability_of_feasibility(
+    threshold: float, at: tf.Tensor, expected: float, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    actual = _jit(probability_of_feasibility)(quadratic_model, threshold, at)
     npt.assert_allclose(actual, expected, rtol=1e-4)
 
 
 @pytest.mark.parametrize('at', [tf.constant([[0.0]]), tf.constant([[-3.4]]), tf.constant([[0.2]])])
 @pytest.mark.parametrize('threshold', [-2.3, 0.2])
-def test_probability_of_feasibility_builder_builds_pof(threshold: float, at: tf.Tensor) -> None:
+def test_probability_of_feasibility_builder_builds_pof(
+    threshold: float,
+    at: tf.Tensor,
+    zero_ds: Dataset,
+    quadratic_model: QuadraticWithUnitVariance,
+) -> None:
     builder = ProbabilityOfFeasibility(threshold)
-    acq = builder.prepare_acquisition_function(zero_dataset(), QuadraticWithUnitVariance())
-    expected = probability_of_feasibility(QuadraticWithUnitVariance(), threshold, at)
+    acq = builder.prepare_acquisition_function(zero_ds, quadratic_model)
+    expected = probability_of_feasibility(quadratic_model, threshold, at)
     npt.assert_allclose(acq(at), expected)
 
 
-@pytest.mark.parametrize('shape', various_shapes() - {()})
-def test_probability_of_feasibility_raises_on_non_scalar_threshold(shape: ShapeLike) -> None:
-    threshold = tf.ones(shape)
+@pytest.mark.parametrize('shape', _NON_SCALAR_SHAPES, ids=str)
+def test_probability_of_feasibility_raises_on_non_scalar_threshold(
+    shape: ShapeLike, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    threshold = cached_ones(shape)
     with pytest.raises(ValueError):
-        probability_of_feasibility(QuadraticWithUnitVariance(), threshold, tf.constant([[0.0]]))
+        probability_of_feasibility(quadratic_model, threshold, tf.constant([[0.0]]))
 
 
-@pytest.mark.parametrize('shape', [[], [0], [2]])
-def test_probability_of_feasibility_raises_on_incorrect_at_shape(shape: ShapeLike) -> None:
-    at = tf.ones(shape)
+@pytest.mark.parametrize('shape', [(), (0,), (2,)])
+def test_probability_of_feasibility_raises_on_incorrect_at_shape(
+    shape: ShapeLike, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    at = cached_ones(shape)
     with pytest.raises(ValueError):
-        probability_of_feasibility(QuadraticWithUnitVariance(), 0.0, at)
+        probability_of_feasibility(quadratic_model, 0.0, at)
 
 
-@pytest.mark.parametrize('shape', various_shapes() - {()})
+@pytest.mark.parametrize('shape', _NON_SCALAR_SHAPES, ids=str)
 def test_probability_of_feasibility_builder_raises_on_non_scalar_threshold(
     shape: ShapeLike
 ) -> None:
-    threshold = tf.ones(shape)
+    threshold = cached_ones(shape)
     with pytest.raises(ValueError):
         ProbabilityOfFeasibility(threshold)
@@ -12,27 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+import math
+from typing import Callable, Dict, List, Mapping
 
+import gpflow
 import pytest
 import numpy.testing as npt
 import tensorflow as tf
 
-from trieste.acquisition.function import NegativeLowerConfidenceBound
+from trieste.acquisition.function import (
+    AcquisitionFunction,
+    AcquisitionFunctionBuilder,
+    NegativePredictiveMean,
+)
 from trieste.acquisition.rule import (
     EfficientGlobalOptimization,
+    KrigingBeliever,
     ThompsonSampling,
     TrustRegion,
     OBJECTIVE,
 )
 from trieste.datasets import Dataset
 from trieste.models import ModelInterface
+from trieste.models.model_interfaces import (
+    GaussianProcessRegression,
+    VariationalGaussianProcess,
+)
 from trieste.space import SearchSpace, DiscreteSearchSpace, Box
 
-from tests.util.misc import one_dimensional_range, zero_dataset
+from tests.util.misc import one_dimensional_range, random_seed, zero_dataset
 from tests.util.model import QuadraticWithUnitVariance
 
 
+_NEGATIVE_PREDICTIVE_MEAN = NegativePredictiveMean().using(OBJECTIVE)
+
+
 @pytest.mark.parametrize('datasets', [{}, {"foo": zero_dataset()}])
 @pytest.mark.parametrize(
     'models', [{}, {"foo": QuadraticWithUnitVariance()}, {OBJECTIVE: QuadraticWithUnitVariance()}]
@@ -70,7 +84,7 @@ def test_thompson_sampling_raises_for_invalid_models_keys(
     (Box(tf.constant([-2.2, -1.0]), tf.constant([1.3, 3.3])), tf.constant([[0.0, 0.0]])),
 ])
 def test_ego(search_space: SearchSpace, expected_minimum: tf.Tensor) -> None:
-    ego = EfficientGlobalOptimization(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    ego = EfficientGlobalOptimization(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[]]), tf.constant([[]]))
     query_point, _ = ego.acquire(
         search_space, {OBJECTIVE: dataset}, {OBJECTIVE: QuadraticWithUnitVariance()}
@@ -78,8 +92,182 @@ def test_ego(search_space: SearchSpace, expected_minimum: tf.Tensor) -> None:
     npt.assert_array_almost_equal(query_point, expected_minimum, decimal=5)
 
 
+class _TwoPeaks(AcquisitionFunctionBuilder):
+    def prepare_acquisition_function(
+        self, datasets: Mapping[str, Dataset], models: Mapping[str, ModelInterface]
+    ) -> AcquisitionFunction:
+        def acquisition(x: tf.Tensor) -> tf.Tensor:
+            return tf.exp(- (x - 0.6) ** 2 / 0.02) + 0.9 * tf.exp(- (x + 0.6) ** 2 / 0.02)
+
+        return acquisition
+
+
+@random_seed(1234)
+def test_ego_finds_global_maximum_of_multimodal_acquisition_function_in_box() -> None:
+    ego = EfficientGlobalOptimization(_TwoPeaks())
+    query_point, _ = ego.acquire(one_dimensional_range(-1, 1), {}, {})
+    npt.assert_allclose(query_point, [[0.6]], rtol=1e-4)
+
+
+def test_ego_raises_for_negative_num_warm_starts() -> None:
+    with pytest.raises(ValueError):
+        EfficientGlobalOptimization(num_warm_starts=-1)
+
+
+def test_ego_returns_no_state_without_warm_starts() -> None:
+    ego = EfficientGlobalOptimization(_TwoPeaks())
+    _, state = ego.acquire(one_dimensional_range(-1, 1), {}, {})
+    assert state is None
+
+
+def test_ego_warm_starts_from_other_optima_in_discrete_search_space() -> None:
+    search_space = DiscreteSearchSpace(tf.constant([[-0.6], [-0.1], [0.1], [0.6]]))
+    ego = EfficientGlobalOptimization(_TwoPeaks(), num_warm_starts=2)
+    query_point, state = ego.acquire(search_space, {}, {})
+    npt.assert_allclose(query_point, [[0.6]])
+    npt.assert_allclose(state, [[-0.6], [0.1]])
+
+
+@random_seed(1234)
+def test_ego_warm_starts_from_other_optima_in_box() -> None:
+    search_space = one_dimensional_range(-1, 1)
+    ego = EfficientGlobalOptimization(_TwoPeaks(), num_warm_starts=2)
+
+    query_point, state = ego.acquire(search_space, {}, {})
+
+    npt.assert_allclose(query_point, [[0.6]], rtol=1e-4)
+    assert state is not None
+    assert 1 <= state.shape[0] <= 2
+    assert search_space.contains_all(state)
+    assert tf.reduce_any(tf.abs(state + 0.6) < 1e-3)
+    assert tf.reduce_all(tf.abs(state - 0.6) > 1e-3)
+
+    query_point, next_state = ego.acquire(search_space, {}, {}, state)
+
+    npt.assert_allclose(query_point, [[0.6]], rtol=1e-4)
+    assert next_state is not None
+    assert tf.reduce_any(tf.abs(next_state + 0.6) < 1e-3)
+
+
+def test_ego_keeps_more_warm_starts_than_the_minimum_number_of_restarts_in_box() -> None:
+    class _ManyPeaks(AcquisitionFunctionBuilder):
+        def prepare_acquisition_function(
+            self, datasets: Mapping[str, Dataset], models: Mapping[str, ModelInterface]
+        ) -> AcquisitionFunction:
+            return lambda x: tf.cos(20 * x)
+
+    peaks = tf.constant([[k * math.pi / 10] for k in range(-3, 4)])
+    ego = EfficientGlobalOptimization(_ManyPeaks(), num_warm_starts=6)
+
+    query_point, state = ego.acquire(one_dimensional_range(-1, 1), {}, {}, peaks)
+
+    assert state is not None
+    optima = tf.sort(tf.concat([query_point, state], axis=0), axis=0)
+    npt.assert_allclose(optima, peaks, atol=1e-4)
+
+
+@pytest.mark.parametrize('num_query_points', [0, -1])
+def test_kriging_believer_raises_for_invalid_num_query_points(num_query_points: int) -> None:
+    with pytest.raises(ValueError):
+        KrigingBeliever(num_query_points)
+
+
+@pytest.mark.parametrize('num_query_points', [1, 2, 5])
+def test_kriging_believer_acquires_num_query_points_in_search_space(num_query_points: int) -> None:
+    search_space = Box(tf.constant([-2.2, -1.0]), tf.constant([1.3, 3.3]))
+    dataset = Dataset(tf.constant([[0.1, 0.2]]), tf.constant([[0.05]]))
+    rule = KrigingBeliever(num_query_points)
+
+    query_points, state = rule.acquire(
+        search_space, {OBJECTIVE: dataset}, {OBJECTIVE: QuadraticWithUnitVariance()}
+    )
+
+    assert query_points.shape == [num_query_points, 2]
+    assert search_space.contains_all(query_points)
+    assert state is None
+
+
+class _UpdateRecordingQuadratic(QuadraticWithUnitVariance):
+    def __init__(self) -> None:
+        self.updates: List[Dataset] = []
+
+    def update(self, dataset: Dataset) -> None:
+        self.updates.append(dataset)
+
+
+class _RecordingNegativePredictiveMean(AcquisitionFunctionBuilder):
+    def __init__(self) -> None:
+        self.datasets: List[Dataset] = []
+        self.models: List[ModelInterface] = []
+
+    def prepare_acquisition_function(
+        self, datasets: Mapping[str, Dataset], models: Mapping[str, ModelInterface]
+    ) -> AcquisitionFunction:
+        self.datasets.append(datasets[OBJECTIVE])
+        self.models.append(models[OBJECTIVE])
+        return _NEGATIVE_PREDICTIVE_MEAN.prepare_acquisition_function(datasets, models)
+
+
+def test_kriging_believer_fantasizes_predicted_mean_with_copies_of_models() -> None:
+    dataset = Dataset(tf.constant([[0.5], [-0.5]]), tf.constant([[0.25], [0.25]]))
+    model = _UpdateRecordingQuadratic()
+    builder = _RecordingNegativePredictiveMean()
+    rule = KrigingBeliever(3, builder)
+
+    query_points, _ = rule.acquire(
+        one_dimensional_range(-1, 1), {OBJECTIVE: dataset}, {OBJECTIVE: model}
+    )
+
+    assert [len(ds.query_points) for ds in builder.datasets] == [2, 3, 4]
+    assert builder.datasets[0] is dataset
+    npt.assert_allclose(builder.datasets[2].query_points[2:], query_points[:2])
+    npt.assert_allclose(builder.datasets[2].observations[2:], query_points[:2] ** 2)
+    assert builder.models[0] is model
+    assert builder.models[1] is not model
+    assert model.updates == []
+
+
+def _trained_gpr() -> GaussianProcessRegression:
+    x = tf.constant([[-0.8], [-0.3], [0.2], [0.7]], gpflow.default_float())
+    model = GaussianProcessRegression(gpflow.models.GPR((x, tf.sin(3 * x)), gpflow.kernels.RBF()))
+    model.optimize()
+    return model
+
+
+def _trained_vgp() -> VariationalGaussianProcess:
+    x = tf.constant([[-0.8], [-0.3], [0.2], [0.7]], gpflow.default_float())
+    vgp = gpflow.models.VGP((x, tf.sin(3 * x)), gpflow.kernels.RBF(), gpflow.likelihoods.Gaussian())
+    model = VariationalGaussianProcess(vgp)
+    model.optimize()
+    return model
+
+
+@pytest.mark.parametrize('build_model', [_trained_gpr, _trained_vgp])
+def test_kriging_believer_leaves_trained_models_unchanged(
+    build_model: Callable[[], GaussianProcessRegression]
+) -> None:
+    model = build_model()
+    x, y = model.model.data
+    query_points = tf.constant([[-0.5], [0.5]], gpflow.default_float())
+    expected_mean, expected_variance = model.predict(query_points)
+    search_space = Box(tf.constant([-1.0], tf.float64), tf.constant([1.0], tf.float64))
+
+    KrigingBeliever(3).acquire(search_space, {OBJECTIVE: Dataset(x, y)}, {OBJECTIVE: model})
+
+    mean, variance = model.predict(query_points)
+    npt.assert_allclose(mean, expected_mean)
+    npt.assert_allclose(variance, expected_variance)
+
+
+def test_kriging_believer_does_not_update_models_for_single_query_point() -> None:
+    model = _UpdateRecordingQuadratic()
+    rule = KrigingBeliever(1, _NEGATIVE_PREDICTIVE_MEAN)
+    rule.acquire(one_dimensional_range(-1, 1), {OBJECTIVE: zero_dataset()}, {OBJECTIVE: model})
+    assert model.updates == []
+
+
 def test_trust_region_for_default_state() -> None:
-    tr = TrustRegion(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    tr = TrustRegion(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[0.1, 0.2]]), tf.constant([[0.012]]))
     lower_bound = tf.constant([-2.2, -1.0])
     upper_bound = tf.constant([1.3, 3.3])
@@ -97,7 +285,7 @@ def test_trust_region_for_default_state() -> None:
 
 
 def test_trust_region_successful_global_to_global_trust_region_unchanged() -> None:
-    tr = TrustRegion(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    tr = TrustRegion(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[0.1, 0.2], [-0.1, -0.2]]), tf.constant([[0.4], [0.3]]))
     lower_bound = tf.constant([-2.2, -1.0])
     upper_bound = tf.constant([1.3, 3.3])
@@ -120,7 +308,7 @@ def test_trust_region_successful_global_to_global_trust_region_unchanged() -> No
 
 
 def test_trust_region_for_unsuccessful_global_to_local_trust_region_unchanged() -> None:
-    tr = TrustRegion(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    tr = TrustRegion(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[0.1, 0.2], [-0.1, -0.2]]), tf.constant([[0.4], [0.5]]))
     lower_bound = tf.constant([-2.2, -1.0])
     upper_bound = tf.constant([1.3, 3.3])
@@ -144,7 +332,7 @@ def test_trust_region_for_unsuccessful_global_to_local_trust_region_unchanged()
 
 
 def test_trust_region_for_successful_local_to_global_trust_region_increased() -> None:
-    tr = TrustRegion(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    tr = TrustRegion(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[0.1, 0.2], [-0.1, -0.2]]), tf.constant([[0.4], [0.3]]))
     lower_bound = tf.constant([-2.2, -1.0])
     upper_bound = tf.constant([1.3, 3.3])
@@ -167,7 +355,7 @@ def test_trust_region_for_successful_local_to_global_trust_region_increased() ->
 
 
 def test_trust_region_for_unsuccessful_local_to_global_trust_region_reduced() -> None:
-    tr = TrustRegion(NegativeLowerConfidenceBound(0).using(OBJECTIVE))
+    tr = TrustRegion(_NEGATIVE_PREDICTIVE_MEAN)
     dataset = Dataset(tf.constant([[0.1, 0.2], [-0.1, -0.2]]), tf.constant([[0.4], [0.5]]))
     lower_bound = tf.constant([-2.2, -1.0])
     upper_bound = tf.constant([1.3, 3.3])
@@ -0,0 +1,37 @@
+# Copyright 2020 The Trieste Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from trieste.datasets import Dataset
+from tests.util.misc import zero_dataset
+from tests.util.model import QuadraticWithUnitVariance
+
+
+@pytest.fixture(scope="module")
+def quadratic_model() -> QuadraticWithUnitVariance:
+    """
+    :return: A :class:`QuadraticWithUnitVariance` shared across the tests in a module. The model is
+        stateless, so it is safe to share.
+    """
+    return QuadraticWithUnitVariance()
+
+
+@pytest.fixture(scope="module")
+def zero_ds() -> Dataset:
+    """
+    :return: A :func:`zero_dataset` shared across the tests in a module. Datasets are immutable, so
+        it is safe to share.
+    """
+    return zero_dataset()
@@ -21,7 +21,7 @@ encapsulation. For example, we should *not* test that methods on the GPflow mode
 (except in the rare case that such behaviour is an explicitly documented behaviour of the
 trieste model).
 """
-from typing import Tuple, Callable, Union
+from typing import List, Tuple, Callable, Union
 
 import gpflow
 from gpflow.models import GPModel, GPR, SGPR, VGP, SVGP
@@ -200,6 +200,118 @@ def test_gaussian_process_regression_optimize(
     assert model.loss() < loss
 
 
+def _rbf_gpr(x: tf.Tensor, y: tf.Tensor) -> GPR:
+    return GPR((x, y), gpflow.kernels.RBF(), gpflow.mean_functions.Linear(), noise_variance=0.1)
+
+
+_X_PREDICT = tf.constant([[-1.2], [0.3], [2.5], [7.0]], gpflow.default_float())
+
+
+def test_gaussian_process_regression_predict_matches_gpflow_gpr() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    reference_mean, reference_variance = _rbf_gpr(x, _3x_plus_10(x)).predict_f(_X_PREDICT)
+
+    mean, variance = model.predict(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+    mean, variance = tf.function(model.predict)(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+
+@pytest.mark.parametrize("x_new", [
+    [[0.0], [1.0], [2.0], [3.0], [4.0], [10.0]],
+    [[0.0], [1.0], [2.0], [3.0], [4.0], [10.0], [-3.0], [0.5]],
+    [[0.0], [1.0], [2.0]],
+    [[4.0], [3.0], [2.0], [1.0], [0.0]],
+])
+def test_gaussian_process_regression_predict_matches_gpflow_gpr_after_update(
+    x_new: List[List[float]]
+) -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    model.predict(_X_PREDICT)
+
+    x_new_ = tf.constant(x_new, gpflow.default_float())
+    model.update(Dataset(x_new_, _3x_plus_10(x_new_)))
+
+    reference_model = _rbf_gpr(x_new_, _3x_plus_10(x_new_))
+    reference_mean, reference_variance = reference_model.predict_f(_X_PREDICT)
+    mean, variance = model.predict(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+
+def test_gaussian_process_regression_predict_reflects_new_hyperparameters() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    model.predict(_X_PREDICT)
+
+    model.model.kernel.lengthscales.assign(2.5)
+    reference_model = _rbf_gpr(x, _3x_plus_10(x))
+    reference_model.kernel.lengthscales.assign(2.5)
+    reference_mean, reference_variance = reference_model.predict_f(_X_PREDICT)
+
+    mean, variance = model.predict(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+
+def test_gaussian_process_regression_compiled_predict_reflects_new_hyperparameters() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    predict = tf.function(model.predict)
+    predict(_X_PREDICT)
+
+    model.model.kernel.lengthscales.assign(2.5)
+    reference_model = _rbf_gpr(x, _3x_plus_10(x))
+    reference_model.kernel.lengthscales.assign(2.5)
+    reference_mean, reference_variance = reference_model.predict_f(_X_PREDICT)
+
+    mean, variance = predict(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+
+def test_gaussian_process_regression_compiled_predict_matches_gpflow_gpr_after_optimize() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    predict = tf.function(model.predict)
+    predict(_X_PREDICT)
+
+    model.optimize()
+    reference_mean, reference_variance = model.model.predict_f(_X_PREDICT)
+
+    mean, variance = predict(_X_PREDICT)
+    npt.assert_allclose(mean, reference_mean)
+    npt.assert_allclose(variance, reference_variance)
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_gaussian_process_regression_predict_gradients_match_gpflow_gpr(compile: bool) -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(_rbf_gpr(x, _3x_plus_10(x)))
+    model.predict(_X_PREDICT)
+    reference_model = _rbf_gpr(x, _3x_plus_10(x))
+
+    def gradients(
+        predict: Callable[[tf.Tensor], Tuple[tf.Tensor, tf.Tensor]], gpr: GPR
+    ) -> List[tf.Tensor]:
+        with tf.GradientTape() as tape:
+            mean, variance = predict(_X_PREDICT)
+            objective = tf.reduce_sum(mean) + tf.reduce_sum(variance)
+
+        return tape.gradient(objective, gpr.trainable_variables)
+
+    predict = tf.function(model.predict) if compile else model.predict
+    expected = gradients(reference_model.predict_f, reference_model)
+
+    for grad, expected_grad in zip(gradients(predict, model.model), expected):
+        npt.assert_allclose(grad, expected_grad)
+
+
 def _3x_plus_gaussian_noise(x: tf.Tensor) -> tf.Tensor:
     return 3.0 * x + np.random.normal(scale=0.01, size=x.shape)
 
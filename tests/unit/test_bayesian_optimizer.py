@@ -12,38 +12,54 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Optional, Tuple, Mapping
+from typing import Callable, Dict, List, Optional, Tuple, Mapping, cast
 
+import gpflow
 import numpy.testing as npt
 import pytest
 import tensorflow as tf
 
-from trieste.acquisition.rule import AcquisitionRule, OBJECTIVE
-from trieste.bayesian_optimizer import BayesianOptimizer, OptimizationResult
+from trieste.acquisition.function import NegativePredictiveMean
+from trieste.acquisition.rule import AcquisitionRule, EfficientGlobalOptimization, OBJECTIVE
+from trieste.bayesian_optimizer import (
+    BayesianOptimizer,
+    LoggingState,
+    ModelSnapshot,
+    OptimizationResult,
+)
 from trieste.datasets import Dataset
 from trieste.models import ModelInterface
-from trieste.space import Box
+from trieste.models.model_interfaces import GaussianProcessRegression
+from trieste.space import Box, DiscreteSearchSpace, SearchSpace
 from trieste.type import ObserverEvaluations, QueryPoints, TensorType
 
 from tests.util.misc import FixedAcquisitionRule, one_dimensional_range, zero_dataset
 from tests.util.model import QuadraticWithUnitVariance, StaticWithUnitVariance
 
 
-@pytest.mark.parametrize('steps', [0, 1, 2, 5])
-def test_bayesian_optimizer_calls_observer_once_per_iteration(steps: int) -> None:
-    class _CountingObserver:
-        call_count = 0
+@tf.function(input_signature=[tf.TensorSpec([None, 1], tf.float32)])
+def _sum_of_squares(x: tf.Tensor) -> tf.Tensor:
+    return tf.reduce_sum(x * x, axis=-1, keepdims=True)
+
+
+class _CountingObserver:
+    call_count = 0
 
-        def __call__(self, x: tf.Tensor) -> Dict[str, Dataset]:
-            self.call_count += 1
-            return {OBJECTIVE: Dataset(x, tf.reduce_sum(x ** 2, axis=-1, keepdims=True))}
+    def __call__(self, x: tf.Tensor) -> Dict[str, Dataset]:
+        self.call_count += 1
+        return {OBJECTIVE: Dataset(x, _sum_of_squares(x))}
 
+
+@pytest.mark.parametrize('steps', [0, 1, 2, 5])
+def test_bayesian_optimizer_calls_observer_once_per_iteration(
+    steps: int, quadratic_model: QuadraticWithUnitVariance
+) -> None:
     observer = _CountingObserver()
     optimizer = BayesianOptimizer(observer, one_dimensional_range(-1, 1))
     data = Dataset(tf.constant([[0.5]]), tf.constant([[0.25]]))
 
     res: OptimizationResult[None] = optimizer.optimize(
-        steps, {OBJECTIVE: data}, {OBJECTIVE: QuadraticWithUnitVariance()}
+        steps, {OBJECTIVE: data}, {OBJECTIVE: quadratic_model}
     )
 
     if res.error is not None:
@@ -71,15 +87,20 @@ def test_bayesian_optimizer_optimize_raises_for_invalid_rule_keys(
         optimizer.optimize(10, datasets, model_specs, rule)
 
 
-def test_bayesian_optimizer_optimize_raises_for_invalid_rule_keys_and_default_acquisition() -> None:
+def test_bayesian_optimizer_optimize_raises_for_invalid_rule_keys_and_default_acquisition(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
     optimizer = BayesianOptimizer(lambda x: x[:1], one_dimensional_range(-1, 1))
     with pytest.raises(ValueError):
-        optimizer.optimize(3, {'foo': zero_dataset()}, {'foo': QuadraticWithUnitVariance()})
+        optimizer.optimize(3, {'foo': zero_ds}, {'foo': quadratic_model})
 
 
 @pytest.mark.parametrize('starting_state, expected_states', [(None, [None, 1, 2]), (3, [3, 4, 5])])
 def test_bayesian_optimizer_uses_specified_acquisition_state(
-    starting_state: Optional[int], expected_states: List[Optional[int]]
+    starting_state: Optional[int],
+    expected_states: List[Optional[int]],
+    zero_ds: Dataset,
+    quadratic_model: QuadraticWithUnitVariance,
 ) -> None:
     class Rule(AcquisitionRule[int, Box]):
         def __init__(self):
@@ -104,7 +125,7 @@ def test_bayesian_optimizer_uses_specified_acquisition_state(
     res = BayesianOptimizer(
         lambda x: {"": Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
     ).optimize(
-        3, {"": zero_dataset()}, {"": QuadraticWithUnitVariance()}, rule, starting_state
+        3, {"": zero_ds}, {"": quadratic_model}, rule, starting_state
     )
 
     if res.error is not None:
@@ -114,12 +135,158 @@ def test_bayesian_optimizer_uses_specified_acquisition_state(
     assert [state.acquisition_state for state in res.history] == expected_states
 
 
-def test_bayesian_optimizer_optimize_returns_default_acquisition_state_of_correct_type() -> None:
+def test_bayesian_optimizer_history_is_unaffected_by_mutation_of_acquisition_state(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    point = tf.constant([[0.0]])
+
+    class Rule(AcquisitionRule[Dict[str, object], Box]):
+        def acquire(
+            self,
+            search_space: Box,
+            datasets: Mapping[str, Dataset],
+            models: Mapping[str, ModelInterface],
+            state: Optional[Dict[str, object]],
+        ) -> Tuple[QueryPoints, Dict[str, object]]:
+            if state is None:
+                state = {"steps": [], "point": point}
+
+            state["steps"].append(len(state["steps"]))  # type: ignore
+            return point, state
+
+    res = BayesianOptimizer(
+        lambda x: {"": Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
+    ).optimize(3, {"": zero_ds}, {"": quadratic_model}, Rule())
+
+    if res.error is not None:
+        raise res.error
+
+    assert res.history[0].acquisition_state is None
+    states = [cast(Dict[str, object], s.acquisition_state) for s in res.history[1:]]
+    assert [state["steps"] for state in states] == [[0], [0, 1]]
+    assert all(state["point"] is point for state in states)
+
+
+def test_bayesian_optimizer_passes_ego_warm_starts_between_steps(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    class _StateRecordingEGO(EfficientGlobalOptimization):
+        def __init__(self) -> None:
+            super().__init__(NegativePredictiveMean().using(OBJECTIVE), num_warm_starts=2)
+            self.states_received: List[Optional[QueryPoints]] = []
+
+        def acquire(
+            self,
+            search_space: SearchSpace,
+            datasets: Mapping[str, Dataset],
+            models: Mapping[str, ModelInterface],
+            state: Optional[QueryPoints] = None,
+        ) -> Tuple[QueryPoints, Optional[QueryPoints]]:
+            self.states_received.append(state)
+            return super().acquire(search_space, datasets, models, state)
+
+    search_space = DiscreteSearchSpace(tf.constant([[-0.5], [-0.2], [0.1], [0.3], [0.7]]))
+    rule = _StateRecordingEGO()
+
+    res = BayesianOptimizer(lambda x: {OBJECTIVE: Dataset(x, x ** 2)}, search_space).optimize(
+        3, {OBJECTIVE: zero_ds}, {OBJECTIVE: quadratic_model}, rule
+    )
+
+    if res.error is not None:
+        raise res.error
+
+    assert rule.states_received[0] is None
+    assert [state.acquisition_state is None for state in res.history] == [True, False, False]
+
+    for received, logged in zip(rule.states_received[1:], res.history[1:]):
+        npt.assert_allclose(received, [[-0.2], [0.3]])
+        npt.assert_array_equal(logged.acquisition_state, received)
+
+
+def test_bayesian_optimizer_history_acquisition_state_copy_preserves_structure(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    point = tf.constant([[0.0]])
+    shared: List[int] = []
+    state: Dict[object, object] = {1: shared, "b": shared, "point": point}
+
+    class Rule(AcquisitionRule[Dict[object, object], Box]):
+        def acquire(
+            self,
+            search_space: Box,
+            datasets: Mapping[str, Dataset],
+            models: Mapping[str, ModelInterface],
+            _: Optional[Dict[object, object]],
+        ) -> Tuple[QueryPoints, Dict[object, object]]:
+            return point, state
+
+    res = BayesianOptimizer(
+        lambda x: {"": Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
+    ).optimize(2, {"": zero_ds}, {"": quadratic_model}, Rule())
+
+    if res.error is not None:
+        raise res.error
+
+    state_copy = cast(Dict[object, object], res.history[-1].acquisition_state)
+    assert state_copy == state
+    assert state_copy[1] is not shared
+    assert state_copy[1] is state_copy["b"]
+    assert state_copy["point"] is point
+
+
+@pytest.mark.parametrize('snapshot_every, expected_states', [
+    (1, [None, 1, 2, 3, 4]), (2, [None, 2, 4]), (3, [None, 3]), (5, [None]), (6, [None])
+])
+def test_bayesian_optimizer_tracks_state_every_snapshot_every_steps(
+    snapshot_every: int,
+    expected_states: List[Optional[int]],
+    zero_ds: Dataset,
+    quadratic_model: QuadraticWithUnitVariance,
+) -> None:
+    class Rule(AcquisitionRule[int, Box]):
+        def acquire(
+            self,
+            search_space: Box,
+            datasets: Mapping[str, Dataset],
+            models: Mapping[str, ModelInterface],
+            state: Optional[int],
+        ) -> Tuple[QueryPoints, int]:
+            return tf.constant([[0.0]]), (state or 0) + 1
+
+    res = BayesianOptimizer(
+        lambda x: {"": Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
+    ).optimize(
+        5, {"": zero_ds}, {"": quadratic_model}, Rule(), snapshot_every=snapshot_every
+    )
+
+    if res.error is not None:
+        raise res.error
+
+    assert [state.acquisition_state for state in res.history] == expected_states
+
+
+@pytest.mark.parametrize('snapshot_every', [0, -1])
+def test_bayesian_optimizer_optimize_raises_for_invalid_snapshot_every(
+    snapshot_every: int, zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    optimizer = BayesianOptimizer(
+        lambda x: {OBJECTIVE: Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
+    )
+
+    with pytest.raises(ValueError):
+        optimizer.optimize(
+            3, {OBJECTIVE: zero_ds}, {OBJECTIVE: quadratic_model}, snapshot_every=snapshot_every
+        )
+
+
+def test_bayesian_optimizer_optimize_returns_default_acquisition_state_of_correct_type(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
     optimizer = BayesianOptimizer(
         lambda x: {OBJECTIVE: Dataset(x, x[:1])}, one_dimensional_range(-1, 1)
     )
     res: OptimizationResult[None] = optimizer.optimize(
-        3, {OBJECTIVE: zero_dataset()}, {OBJECTIVE: QuadraticWithUnitVariance()}
+        3, {OBJECTIVE: zero_ds}, {OBJECTIVE: quadratic_model}
     )
 
     if res.error is not None:
@@ -128,6 +295,72 @@ def test_bayesian_optimizer_optimize_returns_default_acquisition_state_of_correc
     assert all(logging_state.acquisition_state is None for logging_state in res.history)
 
 
+class _TrainingCountingModel(tf.Module, QuadraticWithUnitVariance):
+    def __init__(self) -> None:
+        super().__init__()
+        self.update_count = tf.Variable(0)
+        self.optimize_count = tf.Variable(0)
+
+    def update(self, dataset: Dataset) -> None:
+        self.update_count.assign_add(1)
+
+    def optimize(self) -> None:
+        self.optimize_count.assign_add(1)
+
+
+def test_logging_state_accepts_models_positionally_and_by_keyword(
+    zero_ds: Dataset, quadratic_model: QuadraticWithUnitVariance
+) -> None:
+    positional: LoggingState[int] = LoggingState({"": zero_ds}, {"": quadratic_model}, None)
+    keyword = LoggingState(datasets={"": zero_ds}, models={"": quadratic_model}, acquisition_state=1)
+    assert positional.models[""] is quadratic_model
+    assert keyword.models[""] is quadratic_model
+
+
+def test_bayesian_optimizer_history_models_are_copies_in_the_state_at_each_step(
+    zero_ds: Dataset
+) -> None:
+    model = _TrainingCountingModel()
+    optimizer = BayesianOptimizer(
+        lambda x: {OBJECTIVE: Dataset(x, x ** 2)}, one_dimensional_range(-1, 1)
+    )
+    rule = FixedAcquisitionRule(tf.constant([[0.]]))
+
+    res = optimizer.optimize(3, {OBJECTIVE: zero_ds}, {OBJECTIVE: model}, rule)
+
+    if res.error is not None:
+        raise res.error
+
+    history_models = [
+        cast(_TrainingCountingModel, state.models[OBJECTIVE]) for state in res.history
+    ]
+    assert [int(m.optimize_count) for m in history_models] == [0, 1, 2]
+    assert all(m is not model for m in history_models)
+    assert all(m is state.models[OBJECTIVE] for m, state in zip(history_models, res.history))
+    assert int(model.optimize_count) == 3
+
+
+def test_model_snapshot_restores_gaussian_process_regression() -> None:
+    x = tf.constant([[0.1], [0.5], [0.9]], gpflow.default_float())
+    dataset = Dataset(x, x ** 2)
+    model = GaussianProcessRegression(
+        gpflow.models.GPR((dataset.query_points, dataset.observations), gpflow.kernels.RBF())
+    )
+    snapshot = ModelSnapshot(model, dataset)
+    expected_mean, expected_variance = model.predict(x)
+
+    model.model.kernel.lengthscales.assign(3.0)
+    model.update(dataset + Dataset(x[:1] + 1, x[:1]))
+    restored = cast(GaussianProcessRegression, snapshot.restore())
+
+    assert restored is not model
+    assert snapshot.restore() is restored
+    npt.assert_allclose(restored.model.kernel.lengthscales, 1.0)
+    mean, variance = restored.predict(x)
+    npt.assert_allclose(mean, expected_mean)
+    npt.assert_allclose(variance, expected_variance)
+
+
 def test_bayesian_optimizer_can_use_two_gprs_for_objective_defined_by_two_dimensions() -> None:
     class ExponentialWithUnitVariance(StaticWithUnitVariance):
         def predict(self, query_points: QueryPoints) -> Tuple[ObserverEvaluations, TensorType]:
@@ -141,6 +374,9 @@ def test_bayesian_optimizer_can_use_two_gprs_for_objective_defined_by_two_dimens
     EXPONENTIAL = "exponential"
 
     class AdditionRule(AcquisitionRule[int, Box]):
+        def __init__(self) -> None:
+            self._target: Optional[Callable[[tf.Tensor], tf.Tensor]] = None
+
         def acquire(
                 self,
                 search_space: Box,
@@ -151,21 +387,35 @@ def test_bayesian_optimizer_can_use_two_gprs_for_objective_defined_by_two_dimens
             if previous_state is None:
                 previous_state = 1
 
-            candidate_query_points = search_space.sample(previous_state)
-            linear_predictions, _ = models[LINEAR].predict(candidate_query_points)
-            exponential_predictions, _ = models[EXPONENTIAL].predict(candidate_query_points)
+            if self._target is None:
+                # the models are the same objects on every step, so we can trace once and evaluate
+                # both models in a single graph for every (growing) set of candidates
+                @tf.function(input_signature=[tf.TensorSpec([None, 1], tf.float32)])
+                def target(x: tf.Tensor) -> tf.Tensor:
+                    linear_predictions, _ = models[LINEAR].predict(x)
+                    exponential_predictions, _ = models[EXPONENTIAL].predict(x)
+                    return linear_predictions + exponential_predictions
 
-            target = linear_predictions + exponential_predictions
+                self._target = target
+
+            candidate_query_points = search_space.sample(previous_state)
+            target = self._target(candidate_query_points)
 
-            optimum_idx = tf.argmin(target, axis=0)[0]
-            next_query_points = tf.expand_dims(candidate_query_points[optimum_idx, ...], axis=0)
+            next_query_points = tf.gather(
+                candidate_query_points, tf.argmin(target, axis=0)[:1], axis=0
+            )  # [1, d]
 
             return next_query_points, previous_state * 2
 
+    @tf.function(input_signature=[tf.TensorSpec([None, 1], tf.float32)])
+    def _linear_and_exponential(query_points: tf.Tensor) -> Tuple[tf.Tensor, tf.Tensor]:
+        return 2 * query_points, tf.exp(- query_points)
+
     def linear_and_exponential(query_points: tf.Tensor) -> Dict[str, Dataset]:
+        linear, exponential = _linear_and_exponential(query_points)
         return {
-            LINEAR: Dataset(query_points, 2 * query_points),
-            EXPONENTIAL: Dataset(query_points, tf.exp(- query_points))
+            LINEAR: Dataset(query_points, linear),
+            EXPONENTIAL: Dataset(query_points, exponential)
         }
 
     data = {
@@ -188,3 +438,67 @@ def test_bayesian_optimizer_can_use_two_gprs_for_objective_defined_by_two_dimens
     objective_values = res.datasets[LINEAR].observations + res.datasets[EXPONENTIAL].observations
     min_idx = tf.argmin(objective_values, axis=0)[0]
     npt.assert_allclose(res.datasets[LINEAR].query_points[min_idx], - tf.math.log(2.0), rtol=0.01)
+
+
+@pytest.mark.parametrize('parallel_model_training', [False, True])
+def test_bayesian_optimizer_optimize_returns_error_from_training_any_of_several_models(
+    parallel_model_training: bool, zero_ds: Dataset
+) -> None:
+    class _Error(Exception):
+        pass
+
+    class _BrokenQuadratic(QuadraticWithUnitVariance):
+        def optimize(self) -> None:
+            raise _Error
+
+    working = _TrainingCountingModel()
+    optimizer = BayesianOptimizer(
+        lambda x: {"working": Dataset(x, x ** 2), "broken": Dataset(x, x ** 2)},
+        one_dimensional_range(-1, 1)
+    )
+
+    res = optimizer.optimize(
+        3,
+        {"working": zero_ds, "broken": zero_ds},
+        {"working": working, "broken": _BrokenQuadratic()},
+        FixedAcquisitionRule(tf.constant([[0.]])),
+        parallel_model_training=parallel_model_training,
+    )
+
+    assert isinstance(res.error, _Error)
+    assert int(working.update_count) == 1
+
+
+def test_bayesian_optimizer_parallel_model_training_matches_serial_training() -> None:
+    def observer(x: tf.Tensor) -> Dict[str, Dataset]:
+        return {"sin": Dataset(x, tf.sin(3 * x)), "cos": Dataset(x, tf.cos(3 * x))}
+
+    def build_models(data: Mapping[str, Dataset]) -> Dict[str, ModelInterface]:
+        return {
+            tag: GaussianProcessRegression(
+                gpflow.models.GPR((ds.query_points, ds.observations), gpflow.kernels.RBF())
+            )
+            for tag, ds in data.items()
+        }
+
+    search_space = Box(tf.constant([-1.0], tf.float64), tf.constant([1.0], tf.float64))
+    data = observer(tf.constant([[-0.8], [-0.1], [0.6]], tf.float64))
+    rule = FixedAcquisitionRule(tf.constant([[0.3]], tf.float64))
+    optimizer = BayesianOptimizer(observer, search_space)
+
+    serial = optimizer.optimize(2, data, build_models(data), rule)
+    parallel = optimizer.optimize(
+        2, data, build_models(data), rule, parallel_model_training=True
+    )
+
+    for res in [serial, parallel]:
+        if res.error is not None:
+            raise res.error
+
+    for tag in data:
+        serial_model = cast(GaussianProcessRegression, serial.models[tag])
+        parallel_model = cast(GaussianProcessRegression, parallel.models[tag])
+        npt.assert_allclose(parallel_model.loss(), serial_model.loss())
+        npt.assert_allclose(
+            parallel_model.model.kernel.lengthscales, serial_model.model.kernel.lengthscales
+        )
@@ -93,5 +93,19 @@ def test_concatenate_datasets() -> None:
     assert tf.reduce_all(merged.observations == tf.constant(obs_this + obs_that))
 
 
+def test_concatenate_with_empty_dataset_returns_other_dataset() -> None:
+    dataset = Dataset(tf.constant([[1.2, 3.4], [5.6, 7.8]]), tf.constant([[1.1], [2.2]]))
+    empty = Dataset(tf.zeros((0, 2)), tf.zeros((0, 1)))
+    assert dataset + empty is dataset
+    assert empty + dataset is dataset
+
+
+def test_concatenate_with_empty_dataset_raises_for_different_trailing_shapes() -> None:
+    dataset = Dataset(tf.constant([[1.2, 3.4], [5.6, 7.8]]), tf.constant([[1.1], [2.2]]))
+
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        dataset + Dataset(tf.zeros((0, 3)), tf.zeros((0, 1)))
+
+
 def test_dataset_length() -> None:
     assert len(Dataset(tf.ones((7, 8, 10)), tf.ones((7, 8, 13)))) == 7
@@ -14,29 +14,86 @@
 
 from typing import Tuple, List
 
+import numpy as np
+import numpy.testing as npt
 import pytest
 import tensorflow as tf
 
 from trieste.space import SearchSpace, DiscreteSearchSpace, Box
 
+from tests.util.misc import cached_ones, cached_zeros
+
+
+_POINTS_2D = tf.constant([[-1., .4], [-1., .6], [0., .4], [0., .6], [1., .4], [1., .6]])
+
 
 def _points_in_2D_search_space() -> tf.Tensor:
-    return tf.constant([[-1., .4], [-1., .6], [0., .4], [0., .6], [1., .4], [1., .6]])
+    return _POINTS_2D
+
+
+@pytest.fixture(scope="module")
+def discrete_search_space_2d() -> DiscreteSearchSpace:
+    return DiscreteSearchSpace(_points_in_2D_search_space())
+
+
+@pytest.mark.parametrize(
+    'point', [(-1., .4), (-1., .6), (0., .4), (0., .6), (1., .4), (1., .6)], ids=str
+)
+def test_discrete_search_space_contains_all_its_points(
+        point: Tuple[float, float], discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    assert tf.constant(point) in discrete_search_space_2d
+
+
+@pytest.mark.parametrize('point', [(-1., -.4), (-1., .5), (-2., .4), (-2., .7)], ids=str)
+def test_discrete_search_space_does_not_contain_other_points(
+        point: Tuple[float, float], discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    assert tf.constant(point) not in discrete_search_space_2d
+
+
+def test_discrete_search_space_contains_batch(
+        discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    points = tf.concat([
+        _points_in_2D_search_space(),
+        tf.constant([[-1., -.4], [-1., .5], [-2., .4], [-2., .7]])
+    ], axis=0)
+    contained = discrete_search_space_2d.contains_batch(points)
+    npt.assert_array_equal(contained, [True] * 6 + [False] * 4)
+
 
+@pytest.mark.parametrize('points', [tf.zeros([3]), tf.zeros([3, 1]), tf.zeros([3, 2, 1])])
+def test_discrete_search_space_contains_batch_raises_for_points_of_invalid_shape(
+        points: tf.Tensor, discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    with pytest.raises(ValueError, match='shape'):
+        discrete_search_space_2d.contains_batch(points)
 
-@pytest.mark.parametrize('point', list(_points_in_2D_search_space()))
-def test_discrete_search_space_contains_all_its_points(point: tf.Tensor) -> None:
-    assert point in DiscreteSearchSpace(_points_in_2D_search_space())
 
+@pytest.mark.parametrize('points', [
+    tf.zeros([0, 2]),
+    _points_in_2D_search_space(),
+    tf.constant([[-1., -.4], [0., .6], [-2., .7]]),
+])
+def test_search_space_default_contains_batch_matches_vectorized_implementation(
+        points: tf.Tensor, discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    search_space = discrete_search_space_2d
+    npt.assert_array_equal(
+        SearchSpace.contains_batch(search_space, points), search_space.contains_batch(points)
+    )
 
-@pytest.mark.parametrize('point', [
-    tf.constant([-1., -.4]),
-    tf.constant([-1., .5]),
-    tf.constant([-2., .4]),
-    tf.constant([-2., .7])
+
+@pytest.mark.parametrize('points, expected', [
+    (tf.zeros([0, 2]), True),
+    (_points_in_2D_search_space(), True),
+    (tf.constant([[-1., .4], [-1., .5]]), False),
 ])
-def test_discrete_search_space_does_not_contain_other_points(point: tf.Tensor) -> None:
-    assert point not in DiscreteSearchSpace(_points_in_2D_search_space())
+def test_search_space_contains_all(
+        points: tf.Tensor, expected: bool, discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    assert discrete_search_space_2d.contains_all(points) == expected
 
 
 def _assert_correct_number_of_unique_constrained_samples(
@@ -44,26 +101,34 @@ def _assert_correct_number_of_unique_constrained_samples(
         search_space: SearchSpace,
         samples: tf.Tensor
 ) -> None:
-    assert all(sample in search_space for sample in samples)
-    assert len(samples) == num_samples
+    if num_samples == 0:
+        assert samples.shape[0] == 0
+        return
+
+    assert search_space.contains_all(samples)
 
-    unique_samples = set(tuple(sample.numpy().tolist()) for sample in samples)
+    samples_array = np.ascontiguousarray(samples.numpy())
+    assert samples_array.shape[0] == num_samples
 
-    assert len(unique_samples) == len(samples)
+    # view each row as a single structured element, so rows are compared and hashed as a whole
+    rows = samples_array.view([('', samples_array.dtype)] * samples_array.shape[1])
+    assert np.unique(rows).shape[0] == num_samples
 
 
 @pytest.mark.parametrize('num_samples', [0, 1, 3, 5, 6])
-def test_discrete_search_space_sampling(num_samples: int) -> None:
-    search_space = DiscreteSearchSpace(_points_in_2D_search_space())
+def test_discrete_search_space_sampling(
+        num_samples: int, discrete_search_space_2d: DiscreteSearchSpace
+) -> None:
+    search_space = discrete_search_space_2d
     samples = search_space.sample(num_samples)
     _assert_correct_number_of_unique_constrained_samples(num_samples, search_space, samples)
 
 
 @pytest.mark.parametrize('num_samples', [7, 8, 10])
 def test_discrete_search_space_sampling_raises_when_too_many_samples_are_requested(
-        num_samples: int
+        num_samples: int, discrete_search_space_2d: DiscreteSearchSpace
 ) -> None:
-    search_space = DiscreteSearchSpace(_points_in_2D_search_space())
+    search_space = discrete_search_space_2d
 
     with pytest.raises(ValueError, match='samples'):
         search_space.sample(num_samples)
@@ -82,7 +147,7 @@ def test_box_raises_if_bounds_have_different_shape(
         lower_shape: Tuple[int, ...],
         upper_shape: Tuple[int, ...]
 ) -> None:
-    lower, upper = tf.zeros(lower_shape), tf.ones(upper_shape)
+    lower, upper = cached_zeros(lower_shape), cached_ones(upper_shape)
 
     with pytest.raises(ValueError, match='bound'):
         Box(lower, upper)
@@ -98,7 +163,7 @@ def test_box_raises_if_bounds_have_different_dtypes(
         lower_dtype: Tuple[tf.DType, tf.DType],
         upper_dtype: Tuple[tf.DType, tf.DType]
 ) -> None:
-    lower, upper = tf.zeros((1, 2), dtype=lower_dtype), tf.ones((1, 2), dtype=upper_dtype)
+    lower, upper = cached_zeros((1, 2), lower_dtype), cached_ones((1, 2), upper_dtype)
 
     with pytest.raises(TypeError, match='dtype'):
         Box(lower, upper)
@@ -118,23 +183,45 @@ def test_box_raises_if_any_lower_bound_is_not_less_than_upper_bound(
         Box(lower, upper)
 
 
-@pytest.mark.parametrize('point', [
-    tf.constant([-1., 0., -2.]),   # lower bound
-    tf.constant([2., 1., -.5]),    # upper bound
-    tf.constant([.5, .5, -1.5]),   # approx centre
-    tf.constant([-1., 0., -1.9]),  # near the edge
+_POINTS_IN_BOX_3D = tf.constant([
+    [-1., 0., -2.],   # lower bound
+    [2., 1., -.5],    # upper bound
+    [.5, .5, -1.5],   # approx centre
+    [-1., 0., -1.9],  # near the edge
+])
+
+_POINTS_NOT_IN_BOX_3D = tf.constant([
+    [-1.1, 0., -2.],   # just outside
+    [-.5, -.5, 1.5],   # negative of a contained point
+    [10., -10., 10.],  # well outside
 ])
-def test_box_contains_point(point: tf.Tensor) -> None:
-    assert point in Box(tf.constant([-1., 0., -2.]), tf.constant([2., 1., -.5]))
 
 
-@pytest.mark.parametrize('point', [
-    tf.constant([-1.1, 0., -2.]),   # just outside
-    tf.constant([-.5, -.5, 1.5]),   # negative of a contained point
-    tf.constant([10., -10., 10.]),  # well outside
+@pytest.fixture(scope="module")
+def box_3d() -> Box:
+    return Box(tf.constant([-1., 0., -2.]), tf.constant([2., 1., -.5]))
+
+
+@pytest.mark.parametrize('point, expected', [
+    (_POINTS_IN_BOX_3D[0], True),
+    (_POINTS_IN_BOX_3D[1], True),
+    (_POINTS_NOT_IN_BOX_3D[0], False),
 ])
-def test_box_does_not_contain_point(point: tf.Tensor) -> None:
-    assert point not in Box(tf.constant([-1., 0., -2.]), tf.constant([2., 1., -.5]))
+def test_box_contains_point(point: tf.Tensor, expected: bool, box_3d: Box) -> None:
+    assert (point in box_3d) == expected
+
+
+def test_box_contains_batch(box_3d: Box) -> None:
+    assert tf.reduce_all(box_3d.contains_batch(_POINTS_IN_BOX_3D))
+
+
+def test_box_contains_batch_for_no_contained_points(box_3d: Box) -> None:
+    assert not tf.reduce_any(box_3d.contains_batch(_POINTS_NOT_IN_BOX_3D))
+
+
+def test_box_contains_batch_for_some_contained_points(box_3d: Box) -> None:
+    points = tf.concat([_POINTS_IN_BOX_3D, _POINTS_NOT_IN_BOX_3D], axis=0)
+    npt.assert_array_equal(box_3d.contains_batch(points), [True] * 4 + [False] * 3)
 
 
 @pytest.mark.parametrize('bound_shape, point_shape', _pairs_of_different_shapes())
@@ -142,38 +229,56 @@ def test_box_contains_raises_on_point_of_different_shape(
         bound_shape: Tuple[int],
         point_shape: Tuple[int],
 ) -> None:
-    box = Box(tf.zeros(bound_shape), tf.ones(bound_shape))
-    point = tf.zeros(point_shape)
+    box = Box(cached_zeros(bound_shape), cached_ones(bound_shape))
+    point = cached_zeros(point_shape)
 
     with pytest.raises(ValueError, match='(bound)|(point)'):
         _ = point in box
 
 
+@pytest.mark.parametrize('bound_shape, points_shape', [
+    ((), ()),
+    ((2,), (2,)),
+    ((2,), (3, 1)),
+    ((2,), (3, 2, 1)),
+])
+def test_box_contains_batch_raises_for_points_of_invalid_shape(
+        bound_shape: Tuple[int, ...],
+        points_shape: Tuple[int, ...],
+) -> None:
+    box = Box(cached_zeros(bound_shape), cached_ones(bound_shape))
+
+    with pytest.raises(ValueError, match='shape'):
+        box.contains_batch(cached_zeros(points_shape))
+
+
+@pytest.fixture(scope="module")
+def unit_box() -> Box:
+    return Box(tf.zeros((3,)), tf.ones((3,)))
+
+
 @pytest.mark.parametrize('num_samples', [0, 1, 10])
-def test_box_sampling(num_samples: int) -> None:
-    box = Box(tf.zeros((3,)), tf.ones((3,)))
-    samples = box.sample(num_samples)
-    _assert_correct_number_of_unique_constrained_samples(num_samples, box, samples)
+def test_box_sampling(num_samples: int, unit_box: Box) -> None:
+    samples = unit_box.sample(num_samples)
+    _assert_correct_number_of_unique_constrained_samples(num_samples, unit_box, samples)
 
 
 @pytest.mark.parametrize('num_samples', [0, 1, 10])
 def test_box_discretize_returns_search_space_with_only_points_contained_within_box(
-        num_samples: int
+        num_samples: int, unit_box: Box
 ) -> None:
-    box = Box(tf.zeros((3,)), tf.ones((3,)))
-    dss = box.discretize(num_samples)
+    dss = unit_box.discretize(num_samples)
 
     samples = dss.sample(num_samples)
 
-    assert all(sample in box for sample in samples)
+    assert unit_box.contains_all(samples)
 
 
 @pytest.mark.parametrize('num_samples', [0, 1, 10])
 def test_box_discretize_returns_search_space_with_correct_number_of_points(
-        num_samples: int
+        num_samples: int, unit_box: Box
 ) -> None:
-    box = Box(tf.zeros((3,)), tf.ones((3,)))
-    dss = box.discretize(num_samples)
+    dss = unit_box.discretize(num_samples)
 
     samples = dss.sample(num_samples)
 
@@ -92,9 +92,33 @@ ShapeLike = Union[tf.TensorShape, Tuple[int, ...], List[int]]
 """ Type alias for types that can represent tensor shapes. """
 
 
+@functools.lru_cache(maxsize=None)
+def cached_zeros(shape: Tuple[int, ...], dtype: tf.DType = tf.float32) -> tf.Tensor:
+    """
+    :param shape: The shape of the tensor. Must be a tuple, so that it can be hashed.
+    :param dtype: The dtype of the tensor.
+    :return: A tensor of zeros with the specified ``shape`` and ``dtype``. The same tensor is
+        returned for repeated calls with the same arguments.
+    """
+    return tf.zeros(shape, dtype=dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_ones(shape: Tuple[int, ...], dtype: tf.DType = tf.float32) -> tf.Tensor:
+    """
+    :param shape: The shape of the tensor. Must be a tuple, so that it can be hashed.
+    :param dtype: The dtype of the tensor.
+    :return: A tensor of ones with the specified ``shape`` and ``dtype``. The same tensor is
+        returned for repeated calls with the same arguments.
+    """
+    return tf.ones(shape, dtype=dtype)
+
+
+@functools.lru_cache(maxsize=1)
 def various_shapes() -> FrozenSet[Tuple[int, ...]]:
     """
-    :return: A reasonably comprehensive variety of tensor shapes.
+    :return: A reasonably comprehensive variety of tensor shapes. The same (immutable) set is
+        returned on every call.
     """
     return frozenset(
         {(), (0,), (1,), (0, 0), (1, 0), (0, 1), (3, 4), (1, 0, 3), (1, 2, 3), (1, 2, 3, 4, 5, 6)}
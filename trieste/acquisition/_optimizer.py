@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Callable
+from typing import Callable, Optional
 from functools import singledispatch
 
 import gpflow
@@ -25,10 +25,17 @@ TensorMapping = Callable[[tf.Tensor], tf.Tensor]
 
 
 @singledispatch
-def optimize(space: SearchSpace, target_func: TensorMapping) -> QueryPoints:
+def optimize(
+    space: SearchSpace,
+    target_func: TensorMapping,
+    num_optima: int = 1,
+    initial_points: Optional[QueryPoints] = None,
+) -> QueryPoints:
     """
     Return the point in ``space`` (with shape S) that maximises the function ``target_func``, as the
-    single entry in a 1 by S tensor.
+    single entry in a 1 by S tensor. If ``num_optima`` is greater than one, also return up to
+    ``num_optima - 1`` other (local) maximisers found during the search, in order of decreasing
+    ``target_func`` value, as further entries.
 
     ``target_func`` must satisfy the following:
 
@@ -40,33 +47,93 @@ def optimize(space: SearchSpace, target_func: TensorMapping) -> QueryPoints:
 
     :param space: The space of points over which to search.
     :param target_func: The function to maximise.
-    :return: The point in ``space`` that maximises ``target_func``.
+    :param num_optima: The maximum number of points to return.
+    :param initial_points: Points in ``space`` from which the search may start, in addition to those
+        chosen by the optimizer. This is ignored where it doesn't apply.
+    :return: The point in ``space`` that maximises ``target_func``, followed by any other optima.
     """
     raise TypeError(f"No optimize implementation found for space of type {type(space)}")
 
 
 @optimize.register
-def _discrete_space(space: DiscreteSearchSpace, target_func: TensorMapping) -> QueryPoints:
+def _discrete_space(
+    space: DiscreteSearchSpace,
+    target_func: TensorMapping,
+    num_optima: int = 1,
+    initial_points: Optional[QueryPoints] = None,
+) -> QueryPoints:
     target_func_values = target_func(space.points)
     tf.debugging.assert_shapes(
         [(target_func_values, ("_", 1))],
         message=f"The result of function target_func has an invalid shape.",
     )
-    max_value_idx = tf.argmax(target_func_values, axis=0)[0]
-    return space.points[max_value_idx : max_value_idx + 1]
+
+    if num_optima == 1:
+        max_value_idx = tf.argmax(target_func_values, axis=0)[0]
+        return space.points[max_value_idx : max_value_idx + 1]
+
+    k = tf.minimum(num_optima, tf.shape(target_func_values)[0])
+    _, top_idx = tf.math.top_k(target_func_values[:, 0], k=k)
+    return tf.gather(space.points, top_idx)
+
+
+_NUM_RESTARTS = 5
+"""
+The minimum number of points from which to start the gradient-based search in a :class:`Box`. The
+search starts from at least as many points as the number of optima requested.
+"""
 
 
 @optimize.register
-def _box(space: Box, target_func: TensorMapping) -> QueryPoints:
-    trial_search_space = space.discretize(20 * tf.shape(space.lower)[-1])
-    initial_point = optimize(trial_search_space, target_func)
+def _box(
+    space: Box,
+    target_func: TensorMapping,
+    num_optima: int = 1,
+    initial_points: Optional[QueryPoints] = None,
+) -> QueryPoints:
+    trial_points = space.discretize(20 * tf.shape(space.lower)[-1]).points
+
+    if initial_points is not None:
+        trial_points = tf.concat([tf.cast(initial_points, trial_points.dtype), trial_points], 0)
+
+    trial_values = target_func(trial_points)
+    tf.debugging.assert_shapes(
+        [(trial_values, ("_", 1))],
+        message=f"The result of function target_func has an invalid shape.",
+    )
+    num_restarts = tf.minimum(max(_NUM_RESTARTS, num_optima), tf.shape(trial_values)[0])
+    starting_values, top_idx = tf.math.top_k(trial_values[:, 0], k=num_restarts)
+    starting_points = tf.gather(trial_points, top_idx)  # [R, D]
 
     bijector = tfp.bijectors.Sigmoid(low=space.lower, high=space.upper)
-    variable = tf.Variable(bijector.inverse(initial_point))
+    variable = tf.Variable(bijector.inverse(starting_points))
 
+    # the target is evaluated independently for each point, so the gradient of the sum with respect
+    # to each point is that of the target at that point alone, and we can optimize all the starting
+    # points at once
     def _objective() -> tf.Tensor:
-        return -target_func(bijector.forward(variable))
+        return -tf.reduce_sum(target_func(bijector.forward(variable)))
 
     gpflow.optimizers.Scipy().minimize(_objective, (variable,))
 
-    return bijector.forward(variable)
+    # keep the starting point of any search that didn't improve on it
+    optimized_points = bijector.forward(variable)
+    optimized_values = target_func(optimized_points)[:, 0]
+    improved = optimized_values >= starting_values
+    candidates = tf.where(improved[:, None], optimized_points, starting_points)
+
+    if num_optima == 1:
+        return optimize(DiscreteSearchSpace(candidates), target_func)
+
+    values = tf.where(improved, optimized_values, starting_values)
+    candidates = tf.gather(candidates, tf.argsort(values, direction="DESCENDING"))
+
+    # several searches can converge to the same optimum, so drop any candidate that's within a
+    # small fraction of the box width of a better one
+    scaled = candidates / (space.upper - space.lower)
+    is_close = tf.reduce_max(tf.abs(scaled[:, None, :] - scaled[None, :, :]), axis=-1) < 1e-3
+    is_close_to_better = tf.linalg.band_part(tf.cast(is_close, tf.int32), -1, 0) - tf.eye(
+        tf.shape(candidates)[0], dtype=tf.int32
+    )
+    is_distinct = tf.reduce_all(is_close_to_better == 0, axis=1)
+    return tf.boolean_mask(candidates, is_distinct)[:num_optima]
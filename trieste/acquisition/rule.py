@@ -20,6 +20,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TypeVar, Generic, Optional, Tuple, Mapping, Union
 
+import gpflow
 import tensorflow as tf
 from typing_extensions import Final
 
@@ -79,28 +80,45 @@ corresponding to the optimization objective.
 """
 
 
-class EfficientGlobalOptimization(AcquisitionRule[None, SearchSpace]):
-    """ Implements the Efficient Global Optimization, or EGO, algorithm. """
+class EfficientGlobalOptimization(AcquisitionRule[Optional[QueryPoints], SearchSpace]):
+    """
+    Implements the Efficient Global Optimization, or EGO, algorithm.
 
-    def __init__(self, builder: Optional[AcquisitionFunctionBuilder] = None):
+    The acquisition function changes little between consecutive optimization steps, so its optima
+    from one step are often good places to start searching on the next. This rule can optionally
+    record the best of these optima, other than the point it returns, as its acquisition state, and
+    use them to warm start the search on the next step.
+    """
+
+    def __init__(
+        self, builder: Optional[AcquisitionFunctionBuilder] = None, num_warm_starts: int = 0
+    ):
         """
         :param builder: The acquisition function builder to use.
             :class:`EfficientGlobalOptimization` will attempt to **maximise** the corresponding
             acquisition function. Defaults to :class:`~trieste.acquisition.ExpectedImprovement`
             with tag `OBJECTIVE`.
+        :param num_warm_starts: The maximum number of optima to record as the acquisition state,
+            from which to warm start the search on the next step. If zero, the acquisition state
+            is always `None`.
+        :raise ValueError: If ``num_warm_starts`` is negative.
         """
+        if num_warm_starts < 0:
+            raise ValueError(f"num_warm_starts must be non-negative, got {num_warm_starts}")
+
         if builder is None:
             builder = ExpectedImprovement().using(OBJECTIVE)
 
         self._builder = builder
+        self._num_warm_starts = num_warm_starts
 
     def acquire(
         self,
         search_space: SearchSpace,
         datasets: Mapping[str, Dataset],
         models: Mapping[str, ModelInterface],
-        state: None = None,
-    ) -> Tuple[QueryPoints, None]:
+        state: Optional[QueryPoints] = None,
+    ) -> Tuple[QueryPoints, Optional[QueryPoints]]:
         """
         Return the query point that optimizes the acquisition function produced by `builder` (see
         :meth:`__init__`).
@@ -109,12 +127,117 @@ class EfficientGlobalOptimization(AcquisitionRule[None, SearchSpace]):
             is defined.
         :param datasets: The known observer query points and observations.
         :param models: The models of the specified ``datasets``.
-        :param state: Unused.
-        :return: The single point to query, and `None`.
+        :param state: Points from which to warm start the search, or `None`.
+        :return: The single point to query, and the points from which to warm start the search on
+            the next step, or `None` if ``num_warm_starts`` is zero.
         """
         acquisition_function = self._builder.prepare_acquisition_function(datasets, models)
-        point = _optimizer.optimize(search_space, acquisition_function)
-        return point, None
+        optima = _optimizer.optimize(
+            search_space,
+            acquisition_function,
+            num_optima=self._num_warm_starts + 1,
+            initial_points=state,
+        )
+
+        # the best point is about to be observed, so it's no longer a good place to start a search
+        warm_starts = optima[1:] if self._num_warm_starts else None
+        return optima[:1], warm_starts
+
+
+class KrigingBeliever(AcquisitionRule[None, SearchSpace]):
+    """
+    Implements the *Kriging believer* heuristic for acquiring a batch of query points, so that the
+    observer can evaluate several points on each optimization step. See the following for details:
+
+    ::
+
+        @incollection{ginsbourger2010kriging,
+            title={Kriging is well-suited to parallelize optimization},
+            author={Ginsbourger, David and Le Riche, Rodolphe and Carraro, Laurent},
+            booktitle={Computational intelligence in expensive optimization problems},
+            pages={131--162},
+            year={2010},
+            publisher={Springer}
+        }
+
+    Points are acquired one at a time by maximising an acquisition function. After each point is
+    acquired, a copy of every model is updated as if the observer had returned that model's
+    predicted mean at the point, so that the next point is chosen with these "fantasized"
+    observations in place. The models passed to :meth:`acquire` are left untouched. The copies are
+    never trained on the fantasized observations, so this heuristic suits models whose
+    :meth:`~trieste.models.ModelInterface.update` retains the trained model parameters, such as
+    :class:`~trieste.models.GaussianProcessRegression`.
+    """
+
+    def __init__(self, num_query_points: int, builder: Optional[AcquisitionFunctionBuilder] = None):
+        """
+        :param num_query_points: The number of points to acquire on each step.
+        :param builder: The acquisition function builder to use. :class:`KrigingBeliever` will
+            attempt to **maximise** the corresponding acquisition function for each point in the
+            batch. Defaults to :class:`~trieste.acquisition.ExpectedImprovement` with tag
+            `OBJECTIVE`.
+        :raise ValueError: If ``num_query_points`` is not positive.
+        """
+        if not num_query_points > 0:
+            raise ValueError(
+                f"Number of query points must be greater than 0, got {num_query_points}"
+            )
+
+        if builder is None:
+            builder = ExpectedImprovement().using(OBJECTIVE)
+
+        self._num_query_points = num_query_points
+        self._builder = builder
+
+    def acquire(
+        self,
+        search_space: SearchSpace,
+        datasets: Mapping[str, Dataset],
+        models: Mapping[str, ModelInterface],
+        state: None = None,
+    ) -> Tuple[QueryPoints, None]:
+        """
+        Return a batch of `num_query_points` (see :meth:`__init__`) points that optimize the
+        acquisition function produced by `builder` (see :meth:`__init__`), fantasizing an
+        observation at each point acquired before the next. The fantasized observations are only
+        ever used to update copies of the ``models``.
+
+        :param search_space: The global search space over which the optimization problem
+            is defined.
+        :param datasets: The known observer query points and observations.
+        :param models: The models of the specified ``datasets``.
+        :param state: Unused.
+        :return: The `num_query_points` points to query, and `None`.
+        :raise KeyError: If ``datasets`` does not contain a dataset for each of the ``models``.
+        """
+        fantasized_datasets = dict(datasets)
+        fantasy_models = models
+        points = []
+
+        for i in range(self._num_query_points):
+            acquisition_function = self._builder.prepare_acquisition_function(
+                fantasized_datasets, fantasy_models
+            )
+            point = _optimizer.optimize(search_space, acquisition_function)
+            points.append(point)
+
+            if i == self._num_query_points - 1:
+                break
+
+            # updating a model can discard its trained state, so fantasize with copies
+            if fantasy_models is models:
+                fantasy_models = {
+                    tag: gpflow.utilities.deepcopy(model) for tag, model in models.items()
+                }
+
+            for tag, model in fantasy_models.items():
+                dataset = fantasized_datasets[tag]
+                mean, _ = model.predict(point)
+                fantasy = Dataset(point, tf.cast(mean, dataset.observations.dtype))
+                fantasized_datasets[tag] = dataset + fantasy
+                model.update(fantasized_datasets[tag])
+
+        return tf.concat(points, axis=0), None
 
 
 class ThompsonSampling(AcquisitionRule[None, SearchSpace]):
@@ -18,8 +18,9 @@ from __future__ import annotations
 
 import copy
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Mapping, Optional, Generic, TypeVar, cast
+from typing import Iterator, List, Mapping, Optional, Generic, Tuple, TypeVar, cast
 
 from absl import logging
 import gpflow
@@ -30,6 +31,7 @@ from .datasets import Dataset
 from .models import ModelInterface, create_model_interface, ModelSpec
 from .observer import Observer
 from .space import SearchSpace
+from .type import TensorType
 
 S = TypeVar("S")
 """ Unbound type variable. """
@@ -38,6 +40,91 @@ SP = TypeVar("SP", bound=SearchSpace)
 """ Type variable bound to :class:`SearchSpace`. """
 
 
+class ModelSnapshot:
+    """
+    A record of the state of a :class:`~trieste.models.ModelInterface` at some point during the
+    optimization process, from which a copy of the model in that state can be rebuilt.
+
+    For models that are instances of :class:`tf.Module`, only the values of the model variables are
+    recorded, rather than a copy of the whole model. The model is then rebuilt the first time it's
+    requested, from a copy of the original model *as it is at that time*, by updating it with the
+    recorded data and assigning the recorded variable values. This means that any state of the model
+    other than its variables and data is that of the live model when the model is rebuilt, not when
+    the snapshot was taken. Other models are copied in full.
+    """
+
+    def __init__(self, model: ModelInterface, dataset: Dataset):
+        """
+        :param model: The model to record.
+        :param dataset: The data with which ``model`` is currently updated.
+        """
+        self._dataset = dataset
+        self._values: Optional[Tuple[TensorType, ...]]
+        self._restored: Optional[ModelInterface]
+
+        if isinstance(model, tf.Module):
+            self._model = model
+            self._values = tuple(variable.read_value() for variable in model.variables)
+            self._restored = None
+        else:
+            self._model = gpflow.utilities.deepcopy(model)
+            self._values = None
+            self._restored = self._model
+
+    def restore(self) -> ModelInterface:
+        """
+        :return: A copy of the model in the state it was in when this snapshot was taken. The same
+            copy is returned on every call.
+        :raise ValueError: If the variables of the rebuilt model do not match those recorded.
+        """
+        if self._restored is None:
+            self._restored = self._rebuild()
+
+        return self._restored
+
+    def _rebuild(self) -> ModelInterface:
+        assert self._values is not None
+
+        model = gpflow.utilities.deepcopy(self._model)
+        model.update(self._dataset)
+        variables = model.variables  # type: ignore
+
+        if len(variables) != len(self._values):
+            raise ValueError(
+                f"Expected model to have {len(self._values)} variables, got {len(variables)}"
+            )
+
+        for variable, value in zip(variables, self._values):
+            variable.assign(value)
+
+        return model
+
+
+class _RestoredModels(Mapping[str, ModelInterface]):
+    """
+    A read-only mapping from tags to the models restored from the corresponding
+    :class:`ModelSnapshot`. Each model is restored when it is first looked up.
+    """
+
+    def __init__(self, snapshots: Mapping[str, ModelSnapshot]):
+        """
+        :param snapshots: The model snapshot for each tag.
+        """
+        self._snapshots = snapshots
+
+    def __getitem__(self, tag: str) -> ModelInterface:
+        """
+        :raise ValueError: If the model can't be rebuilt from its snapshot.
+        """
+        return self._snapshots[tag].restore()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshots)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
 @dataclass(frozen=True)
 class LoggingState(Generic[S]):
     """
@@ -86,6 +173,8 @@ class BayesianOptimizer(Generic[SP]):
         acquisition_rule: Optional[AcquisitionRule[S, SP]] = None,
         acquisition_state: Optional[S] = None,
         track_state: bool = True,
+        snapshot_every: int = 1,
+        parallel_model_training: bool = False,
     ) -> OptimizationResult[S]:
         """
         Attempt to find the minimizer of the ``observer`` in the ``search_space`` (both specified at
@@ -127,7 +216,18 @@ class BayesianOptimizer(Generic[SP]):
             This argument allows the caller to restore the optimization process from a previous
             :class:`LoggingState`.
         :param track_state: If `True`, this method saves the optimization state at the start of each
-            step.
+            step. The models in the saved state are recorded as snapshots (see
+            :class:`ModelSnapshot`), and each is only rebuilt when it is first accessed, from a copy
+            of the corresponding live model *as it is at that time*. The rebuilt model has the
+            recorded data and variable values, but anything else about it, such as its structure or
+            configuration, is that of the live model. Reconfiguring a model after this method
+            returns will therefore change any history models not yet accessed.
+        :param snapshot_every: If ``track_state`` is `True`, save the optimization state only at the
+            start of every ``snapshot_every``-th step, starting from the first. This reduces the
+            cost of tracking the state for long optimization runs.
+        :param parallel_model_training: If `True`, update and optimize the models for different tags
+            concurrently, each on its own thread. Only use this if the models share no state, such
+            as a kernel or likelihood object, else they may be trained incorrectly.
         :return: The updated models, data, history containing information from every optimization
             step (see ``track_state``), and the error if any error was encountered during
             optimization.
@@ -135,6 +235,7 @@ class BayesianOptimizer(Generic[SP]):
             - the keys in ``datasets`` and ``model_specs`` do not match
             - ``datasets`` or ``model_specs`` are empty
             - the default `acquisition_rule` is used and the tags are not `OBJECTIVE`.
+            - ``snapshot_every`` is not positive.
         """
         if datasets.keys() != model_specs.keys():
             raise ValueError(
@@ -145,6 +246,9 @@ class BayesianOptimizer(Generic[SP]):
         if not datasets:
             raise ValueError("dicts of datasets and model_specs must be populated.")
 
+        if snapshot_every < 1:
+            raise ValueError(f"snapshot_every must be positive, got {snapshot_every}")
+
         if acquisition_rule is None:
             if datasets.keys() != {OBJECTIVE}:
                 raise ValueError(
@@ -159,33 +263,77 @@ class BayesianOptimizer(Generic[SP]):
 
         for step in range(num_steps):
             try:
-                if track_state:
+                if track_state and step % snapshot_every == 0:
                     _save_to_history(history, datasets, models, acquisition_state)
 
-                query_points, acquisition_state = acquisition_rule.acquire(
-                    self.search_space, datasets, models, acquisition_state
+                # annotate the result so that S binds to the rule's state type, rather than that of
+                # the (optional) acquisition_state
+                step_result: Tuple[Mapping[str, Dataset], S] = self._step(
+                    datasets, models, acquisition_rule, acquisition_state, parallel_model_training
                 )
-
-                observer_output = self.observer(query_points)
-
-                datasets = {tag: datasets[tag] + observer_output[tag] for tag in observer_output}
-
-                for tag, model in models.items():
-                    model.update(datasets[tag])
-                    model.optimize()
+                datasets, acquisition_state = step_result
 
             except Exception as error:
-                tf.print(
-                    f"Optimization failed at step {step}, encountered error with traceback:"
-                    f"\n{traceback.format_exc()}"
-                    f"\nAborting process and returning results",
-                    output_stream=logging.ERROR,
-                )
+                if logging.level_error():
+                    logging.error(
+                        "Optimization failed at step %d, encountered error with traceback:"
+                        "\n%s"
+                        "\nAborting process and returning results",
+                        step,
+                        traceback.format_exc(),
+                    )
 
                 return OptimizationResult(datasets, models, history, error)
 
         return OptimizationResult(datasets, models, history, None)
 
+    def _step(
+        self,
+        datasets: Mapping[str, Dataset],
+        models: Mapping[str, ModelInterface],
+        acquisition_rule: AcquisitionRule[S, SP],
+        acquisition_state: Optional[S],
+        parallel_model_training: bool,
+    ) -> Tuple[Mapping[str, Dataset], S]:
+        """
+        Run a single step of the Bayesian optimization loop: acquire new query points, observe them,
+        and update the ``models`` in place with the extended data.
+
+        :param datasets: The known observer query points and observations for each tag.
+        :param models: The model for each tag.
+        :param acquisition_rule: The acquisition rule.
+        :param acquisition_state: The acquisition state from the previous step.
+        :param parallel_model_training: Whether to train the models concurrently.
+        :return: The extended datasets and the new acquisition state.
+        """
+        query_points, acquisition_state = acquisition_rule.acquire(
+            self.search_space, datasets, models, acquisition_state
+        )
+
+        observer_output = self.observer(query_points)
+
+        datasets = {tag: datasets[tag] + observer_output[tag] for tag in observer_output}
+
+        if parallel_model_training and len(models) > 1:
+            with ThreadPoolExecutor(max_workers=len(models)) as executor:
+                futures = [
+                    executor.submit(_update_and_optimize, model, datasets[tag])
+                    for tag, model in models.items()
+                ]
+
+                for future in futures:
+                    future.result()
+        else:
+            for tag, model in models.items():
+                _update_and_optimize(model, datasets[tag])
+
+        return datasets, acquisition_state
+
+
+def _update_and_optimize(model: ModelInterface, dataset: Dataset) -> None:
+    model.update(dataset)
+    model.optimize()
+
 
 def _save_to_history(
     history: List[LoggingState[S]],
@@ -193,7 +341,10 @@ def _save_to_history(
     models: Mapping[str, ModelInterface],
     acquisition_state: Optional[S],
 ) -> None:
-    models_copy = {tag: gpflow.utilities.deepcopy(m) for tag, m in models.items()}
+    model_snapshots = {tag: ModelSnapshot(m, datasets[tag]) for tag, m in models.items()}
     datasets_copy = {tag: ds for tag, ds in datasets.items()}
-    logging_state = LoggingState(datasets_copy, models_copy, copy.deepcopy(acquisition_state))
+    logging_state = LoggingState(
+        datasets_copy, _RestoredModels(model_snapshots), copy.deepcopy(acquisition_state)
+    )
     history.append(logging_state)
+
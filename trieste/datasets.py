@@ -37,8 +37,16 @@ class Dataset:
         :raise ValueError (or InvalidArgumentError): If ``query_points`` or ``observations`` have
             rank less than two, or they have unequal shape in any but their last dimension.
         """
-        tf.debugging.assert_rank_at_least(self.query_points, 2)
-        tf.debugging.assert_rank_at_least(self.observations, 2)
+        for name, tensor in [
+            ("query_points", self.query_points), ("observations", self.observations)
+        ]:
+            rank = tf.TensorShape(tensor.shape).rank
+
+            # only defer to a runtime check where we can't check the rank statically
+            if rank is None:
+                tf.debugging.assert_rank_at_least(tensor, 2)
+            elif rank < 2:
+                raise ValueError(f"{name} must have rank at least two, got shape {tensor.shape}")
 
         if self.query_points.shape[:-1] != self.observations.shape[:-1]:
             raise ValueError(
@@ -74,6 +82,14 @@ class Dataset:
         :raise InvalidArgumentError: If the shapes of the `query_points` in each :class:`Dataset`
             differ in any but the zeroth dimension. The same applies for `observations`.
         """
+        # avoid copying the data when there's nothing to add to it
+        if _have_same_trailing_shapes_and_dtypes(self, rhs):
+            if self.query_points.shape[0] == 0:
+                return rhs
+
+            if rhs.query_points.shape[0] == 0:
+                return self
+
         return Dataset(
             tf.concat([self.query_points, rhs.query_points], axis=0),
             tf.concat([self.observations, rhs.observations], axis=0),
@@ -84,3 +100,12 @@ class Dataset:
         :return: The number of query points, or equivalently the number of observations.
         """
         return tf.shape(self.observations)[0]
+
+
+def _have_same_trailing_shapes_and_dtypes(this: Dataset, that: Dataset) -> bool:
+    return (
+        this.query_points.shape[1:] == that.query_points.shape[1:]
+        and this.observations.shape[1:] == that.observations.shape[1:]
+        and this.query_points.dtype == that.query_points.dtype
+        and this.observations.dtype == that.observations.dtype
+    )
@@ -41,6 +41,30 @@ class SearchSpace(ABC):
             scalar boolean `tf.Tensor` instead of the `bool` itself.
         """
 
+    def contains_batch(self, points: TensorType) -> tf.Tensor:
+        """
+        Check each of ``points`` for membership of this search space. This default implementation
+        checks one point at a time with :meth:`__contains__`. Subclasses are encouraged to override
+        it with a vectorized implementation.
+
+        :param points: The points to check for membership of this :class:`SearchSpace`, indexed by
+            the leading dimension.
+        :return: A boolean tensor of shape [N], containing `True` for each of the N points in
+            ``points`` that is a member of this search space, else `False`.
+        """
+        is_member = [bool(point in self) for point in points]
+        return tf.constant(is_member, dtype=tf.bool, shape=[len(is_member)])
+
+    def contains_all(self, points: TensorType) -> tf.Tensor:
+        """
+        :param points: The points to check for membership of this :class:`SearchSpace`, indexed by
+            the leading dimension.
+        :return: A scalar boolean tensor, `True` if all of ``points`` are members of this search
+            space, else `False`.
+        :raise ValueError: If :meth:`contains_batch` raises for ``points``.
+        """
+        return tf.reduce_all(self.contains_batch(points))
+
 
 class DiscreteSearchSpace(SearchSpace):
     r"""
@@ -74,6 +98,25 @@ class DiscreteSearchSpace(SearchSpace):
 
         return False
 
+    def contains_batch(self, points: TensorType) -> tf.Tensor:
+        """
+        :param points: The points to check for membership of this :class:`SearchSpace`, with shape
+            [N, D], where D is the dimensionality of this space.
+        :return: A boolean tensor of shape [N], containing `True` for each point in ``points`` that
+            is a member of this search space, else `False`.
+        :raise ValueError: If ``points`` does not have rank two, or its last dimension differs from
+            that of the points in this search space.
+        """
+        if not (tf.rank(points) == 2 and tf.shape(points)[-1] == tf.shape(self._points)[-1]):
+            raise ValueError(
+                f"Points must have shape [N, {self._points.shape[-1]}], got {points.shape}"
+            )
+
+        is_point_for_all_points = tf.reduce_all(
+            tf.expand_dims(points, axis=1) == self._points, axis=-1
+        )  # [N, M]
+        return tf.reduce_any(is_point_for_all_points, axis=-1)
+
     def sample(self, num_samples: int) -> tf.Tensor:
         """
         :param num_samples: The number of points to sample from this search space.
@@ -156,6 +199,29 @@ class Box(SearchSpace):
 
         return tf.reduce_all(value >= self._lower) and tf.reduce_all(value <= self._upper)
 
+    def contains_batch(self, points: TensorType) -> tf.Tensor:
+        """
+        Vectorized version of :meth:`__contains__`, checking membership of a number of points at
+        once.
+
+        :param points: The points to check for membership of this :class:`SearchSpace`, with shape
+            [N] + S, where S is the shape of the bounds.
+        :return: A boolean tensor of shape [N], containing `True` for each point in ``points`` that
+            is a member of this search space, else `False`.
+        :raise ValueError: If the shape of each point in ``points`` differs from that of the search
+            space bounds.
+        """
+        if not (
+            tf.rank(points) == tf.rank(self._lower) + 1
+            and tf.reduce_all(tf.shape(points)[1:] == tf.shape(self._lower))
+        ):
+            raise ValueError(
+                f"Points must have shape [N] + {self._lower.shape}, got {points.shape}"
+            )
+
+        is_within_bounds = tf.logical_and(points >= self._lower, points <= self._upper)
+        return tf.reduce_all(is_within_bounds, axis=tf.range(1, tf.rank(points)))
+
     def sample(self, num_samples: int) -> tf.Tensor:
         dim = tf.shape(self._lower)[-1]
         return tf.random.uniform(